@@ -6,7 +6,7 @@ import json
 
 from immo_core import ModelParameters, FinancialModel
 from immo_core.data import get_location_defaults, FIXED_DEFAULTS
-from immo_core.fiscal import FiscalAdvisor, LeaseType
+from immo_core.fiscal import FiscalAdvisor, LeaseType, DEDUCTIBLE_EXPENSE_COLUMNS, YEAR1_FISCAL_COLUMNS
 
 from ..schemas import (
     ExpertSimulationRequest,
@@ -197,29 +197,16 @@ async def simulate_expert(req: ExpertSimulationRequest):
         
         # Yearly cashflows
         cf_yearly = cf.groupby("Year")["Net Change in Cash"].sum()
-        cumulative = 0
-        yearly_cashflows = []
-        for year, net_change in cf_yearly.items():
-            cumulative += net_change
-            yearly_cashflows.append(YearlyCashFlow(
-                year=int(year),
-                net_change=float(net_change),
-                cumulative=float(cumulative)
-            ))
+        yearly_cashflows = [
+            YearlyCashFlow(year=int(year), net_change=float(net_change), cumulative=float(cumulative))
+            for year, net_change, cumulative in zip(cf_yearly.index, cf_yearly, cf_yearly.cumsum())
+        ]
         
         # Fiscal comparison
-        pnl_year1 = pnl[pnl["Year"] == 1]
-        gross_revenue = pnl_year1["Gross Operating Income"].sum()
-        deductible = abs(
-            pnl_year1["Property Tax"].sum() +
-            pnl_year1["Condo Fees"].sum() +
-            pnl_year1["PNO Insurance"].sum() +
-            pnl_year1["Maintenance"].sum() +
-            pnl_year1["Management Fees"].sum() +
-            pnl_year1["Loan Interest"].sum() +
-            pnl_year1["Loan Insurance"].sum()
-        )
-        depreciation = abs(pnl_year1["Depreciation/Amortization"].sum())
+        pnl_year1 = pnl.loc[pnl["Year"] == 1, YEAR1_FISCAL_COLUMNS].sum()
+        gross_revenue = pnl_year1["Gross Operating Income"]
+        deductible = abs(pnl_year1[DEDUCTIBLE_EXPENSE_COLUMNS].sum())
+        depreciation = abs(pnl_year1["Depreciation/Amortization"])
         
         advisor = FiscalAdvisor(tmi=req.tmi)
         comparison = advisor.compare_regimes(
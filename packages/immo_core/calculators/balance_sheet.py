@@ -3,8 +3,9 @@
 import pandas as pd
 import numpy_financial as npf
 import numpy as np # For loan balance calculation if needed
-from typing import Dict, List
+from typing import Dict
 from ..models.params import ModelParameters
+from ..utils.frames import column_as_array
 # No direct import of PnL needed, as we receive its results (DataFrame)
 
 class BalanceSheet:
@@ -77,76 +78,42 @@ class BalanceSheet:
                                self._initial_renovation_cost - 
                                self._initial_loan_balance)
 
-        # Initialize with Month 0 data
-        bs_data: Dict[str, List[float]] = {
-            "Year": [0],
-            "Property Cost": [self._initial_property_cost],
-            "Property Accumulated Depreciation": [0.0],
-            "Furnishing Cost": [self._initial_furnishing_cost],
-            "Furnishing Accumulated Depreciation": [0.0],
-            "Renovation Cost": [self._initial_renovation_cost],
-            "Renovation Accumulated Depreciation": [0.0],
-            "Cash": [0.0],
-            "Loan Balance": [self._initial_loan_balance],
-            "Initial Equity": [initial_book_equity],
-            "Retained Earnings": [0.0],
-        }
+        months = np.arange(1, num_months + 1)
+        years = (months - 1) // 12 + 1
+
+        # --- Extract P&L / CF / loan inputs once as month-aligned arrays ---
+        net_income = column_as_array(pnl_df, "Net Income", months)
+        ending_cash = column_as_array(cf_df, "Ending Cash Balance", months)
+        loan_balance = column_as_array(loan_schedule, "Ending Balance", months)
 
-        # Monthly Loop (Starts from Month 1)
+        # --- Accumulated depreciation (capped at asset cost) ---
+        # Monthly charges are non-negative, so capping the running sum is
+        # equivalent to capping month by month.
         # TODO: reprendre la logique de dépréciation avec la rénovation + soucis dans le cash
-        for month in range(1, num_months + 1):
-            current_year = (month - 1) // 12 + 1
-            bs_data["Year"].append(current_year)
-
-            # Get previous month's BS data
-            prev_prop_acc_dep = bs_data["Property Accumulated Depreciation"][month-1]
-            prev_furn_acc_dep = bs_data["Furnishing Accumulated Depreciation"][month-1]
-            prev_reno_acc_dep = bs_data["Renovation Accumulated Depreciation"][month-1]
-            prev_loan_balance = bs_data["Loan Balance"][month-1]
-            prev_retained_earnings = bs_data["Retained Earnings"][month-1]
-            # prev_cash is no longer directly used for calculation, but needed for CF's BegBal
-
-            # Get current month's P&L and CF data
-            pnl_month_data = pnl_df.loc[month] if month in pnl_df.index else pd.Series(dtype='float64')
-            cf_month_data = cf_df.loc[month] if month in cf_df.index else pd.Series(dtype='float64')
-            net_income_month = pnl_month_data.get("Net Income", 0.0)
-            interest_month = pnl_month_data.get("Loan Interest", 0.0)
-            prop_dep_month = self._monthly_property_depreciation if current_year <= self.params.lmnp_amortization_property_years else 0.0
-            furn_dep_month = self._monthly_furnishing_depreciation if current_year <= self.params.lmnp_amortization_furnishing_years else 0.0
-            reno_dep_month = self._monthly_renovation_depreciation if current_year <= self.params.lmnp_amortization_renovation_years else 0.0
-
-            # --- Calculate BS Items for Current Month ---
-
-            # Assets (Property, Furnishing - same as before)
-            bs_data["Property Cost"].append(self._initial_property_cost)
-            current_prop_acc_dep = min(prev_prop_acc_dep + prop_dep_month, self._initial_property_cost)
-            bs_data["Property Accumulated Depreciation"].append(current_prop_acc_dep)
-            bs_data["Furnishing Cost"].append(self._initial_furnishing_cost)
-            current_furn_acc_dep = min(prev_furn_acc_dep + furn_dep_month, self._initial_furnishing_cost)
-            bs_data["Furnishing Accumulated Depreciation"].append(current_furn_acc_dep)
-            bs_data["Renovation Cost"].append(self._initial_renovation_cost)
-            current_reno_acc_dep = min(prev_reno_acc_dep + reno_dep_month, self._initial_renovation_cost)
-            bs_data["Renovation Accumulated Depreciation"].append(current_reno_acc_dep)
-
-            # --- Cash (UPDATED) ---
-            # cf_ending_cash = cf_month_data.get("Ending Cash Balance", 0.0)
-            # depreciation_month = pnl_month_data.get("Depreciation/Amortization", 0.0)
-            # current_cash = cf_ending_cash - depreciation_month
-            current_cash = cf_month_data.get("Ending Cash Balance", 0.0)
-            bs_data["Cash"].append(current_cash)
-
-            # --- End Cash Update ---
-
-            # Liabilities & Equity (Loan Balance, Retained Earnings - same logic as before)
-            current_loan_balance = 0.0
-            
-            if month in loan_schedule.index:
-                current_loan_balance = loan_schedule.loc[month, 'Ending Balance']
-
-            bs_data["Loan Balance"].append(current_loan_balance)
-            bs_data["Initial Equity"].append(self._initial_equity)
-            current_retained_earnings = prev_retained_earnings + net_income_month
-            bs_data["Retained Earnings"].append(current_retained_earnings)
+        prop_dep = np.where(years <= self.params.lmnp_amortization_property_years, self._monthly_property_depreciation, 0.0)
+        furn_dep = np.where(years <= self.params.lmnp_amortization_furnishing_years, self._monthly_furnishing_depreciation, 0.0)
+        reno_dep = np.where(years <= self.params.lmnp_amortization_renovation_years, self._monthly_renovation_depreciation, 0.0)
+        prop_acc_dep = np.minimum(np.cumsum(prop_dep), self._initial_property_cost)
+        furn_acc_dep = np.minimum(np.cumsum(furn_dep), self._initial_furnishing_cost)
+        reno_acc_dep = np.minimum(np.cumsum(reno_dep), self._initial_renovation_cost)
+
+        # --- Retained earnings accumulate monthly Net Income ---
+        retained_earnings = np.cumsum(net_income)
+
+        # Month 0 (initial state) followed by months 1..num_months
+        bs_data: Dict[str, np.ndarray] = {
+            "Year": np.concatenate(([0], years)),
+            "Property Cost": np.full(num_months + 1, self._initial_property_cost),
+            "Property Accumulated Depreciation": np.concatenate(([0.0], prop_acc_dep)),
+            "Furnishing Cost": np.full(num_months + 1, self._initial_furnishing_cost),
+            "Furnishing Accumulated Depreciation": np.concatenate(([0.0], furn_acc_dep)),
+            "Renovation Cost": np.full(num_months + 1, self._initial_renovation_cost),
+            "Renovation Accumulated Depreciation": np.concatenate(([0.0], reno_acc_dep)),
+            "Cash": np.concatenate(([0.0], ending_cash)),
+            "Loan Balance": np.concatenate(([self._initial_loan_balance], loan_balance)),
+            "Initial Equity": np.concatenate(([initial_book_equity], np.full(num_months, self._initial_equity))),
+            "Retained Earnings": np.concatenate(([0.0], retained_earnings)),
+        }
 
         # Create DataFrame
         df_bs = pd.DataFrame(bs_data)
@@ -1,9 +1,10 @@
 # In file: scripts/_4_cash_flow.py
 
 import pandas as pd
-import numpy as np # Might be needed for more complex calcs later
-from typing import Dict, List
+import numpy as np
+from typing import Dict
 from ..models.params import ModelParameters
+from ..utils.frames import column_as_array
 
 class CashFlow:
     """
@@ -49,95 +50,60 @@ class CashFlow:
             A pandas DataFrame containing the monthly Cash Flow statement (Index 1 to num_months).
         """
         num_months = self.params.holding_period_years * 12
-
-        # --- Data Storage ---
-        # CF statement runs from month 1 onwards
-        cf_data: Dict[str, List[float]] = {
-            "Year": [(m - 1) // 12 + 1 for m in range(1, num_months + 1)],
+        months = np.arange(1, num_months + 1)
+
+        # --- Extract inputs once as month-aligned arrays ---
+        net_income = column_as_array(pnl_df, "Net Income", months)
+        depreciation = column_as_array(pnl_df, "Depreciation/Amortization", months) # Non-cash expense
+        principal_repayment_outflow = column_as_array(loan_schedule, "Principal Payment", months)
+        beginning_cash = column_as_array(bs_df, "Cash", months - 1) # Cash at end of previous month
+
+        # --- 1. Cash Flow from Operations (CFO) ---
+        # Indirect method: Start with Net Income, add back non-cash charges
+        # Add/Subtract changes in working capital accounts (N/A for simple model)
+        cfo = net_income + depreciation
+
+        # --- 2. Cash Flow from Investing (CFI) ---
+        # The entire acquisition cost is an outflow for investing in Month 1
+        acquisition_outflow = np.zeros(num_months)
+        acquisition_outflow[:1] = -self._total_acquisition_cost
+        # capital_expenditures = 0.0 # Placeholder
+        cfi = acquisition_outflow # + capital_expenditures
+
+        # --- 3. Cash Flow from Financing (CFF) ---
+        # Loan proceeds and equity are inflows in Month 1 only
+        loan_proceeds = np.zeros(num_months)
+        loan_proceeds[:1] = self._loan_amount
+        equity_injected = np.zeros(num_months)
+        equity_injected[:1] = self._initial_equity
+
+        # CFF = Inflows - Outflows
+        cff = loan_proceeds + equity_injected - principal_repayment_outflow
+
+        # --- 4. Summary ---
+        net_change_in_cash = cfo + cfi + cff
+        ending_cash = beginning_cash + net_change_in_cash
+
+        cf_data: Dict[str, np.ndarray] = {
+            "Year": (months - 1) // 12 + 1,
             # Operating
-            "Net Income": [],
-            "Depreciation/Amortization": [],
-            # "(+/-) Change in Working Capital": [0.0] * num_months, # Assume 0 for now
-            "Cash Flow from Operations (CFO)": [],
+            "Net Income": net_income,
+            "Depreciation/Amortization": depreciation,
+            "Cash Flow from Operations (CFO)": cfo,
             # Investing
-            "Acquisition Costs Outflow": [],
-            # "Capital Expenditures": [0.0] * num_months, # Placeholder
-            "Cash Flow from Investing (CFI)": [],
+            "Acquisition Costs Outflow": acquisition_outflow, # Recorded as negative
+            "Cash Flow from Investing (CFI)": cfi,
             # Financing
-            "Loan Proceeds": [],
-            "Equity Injected": [],
-            "Loan Principal Repayment": [],
-            "Cash Flow from Financing (CFF)": [],
+            "Loan Proceeds": loan_proceeds,
+            "Equity Injected": equity_injected,
+            "Loan Principal Repayment": -principal_repayment_outflow, # Report as negative
+            "Cash Flow from Financing (CFF)": cff,
             # Summary
-            "Net Change in Cash": [],
-            "Beginning Cash Balance": [],
-            "Ending Cash Balance": []
+            "Net Change in Cash": net_change_in_cash,
+            "Beginning Cash Balance": beginning_cash,
+            "Ending Cash Balance": ending_cash
         }
 
-        # --- Monthly Loop (Month 1 to num_months) ---
-        for month in range(1, num_months + 1):
-            # Get P&L data for the current month
-            pnl_month_data = pnl_df.loc[month] if month in pnl_df.index else pd.Series(dtype='float64')
-            net_income = pnl_month_data.get("Net Income", 0.0)
-            depreciation = pnl_month_data.get("Depreciation/Amortization", 0.0) # Non-cash expense
-
-            # Get Balance Sheet data for previous (month-1) and current (month) state
-            bs_prev_month = bs_df.loc[month - 1] if (month - 1) in bs_df.index else pd.Series(dtype='float64')
-            bs_curr_month = bs_df.loc[month] if month in bs_df.index else pd.Series(dtype='float64')
-
-            # --- 1. Cash Flow from Operations (CFO) ---
-            # Indirect method: Start with Net Income, add back non-cash charges
-            # Add/Subtract changes in working capital accounts (N/A for simple model)
-            # if month == 1:
-            #     # Don't add back depreciation in Month 1 since assets just acquired
-            #     cfo = net_income  # Don't add depreciation
-            # else:
-            cfo = net_income + depreciation 
-            cf_data["Net Income"].append(net_income)
-            cf_data["Depreciation/Amortization"].append(depreciation)
-            cf_data["Cash Flow from Operations (CFO)"].append(cfo)
-
-            # --- 2. Cash Flow from Investing (CFI) ---
-            acquisition_outflow = 0.0
-            if month == 1:
-                # The entire acquisition cost is an outflow for investing
-                acquisition_outflow = -self._total_acquisition_cost
-
-            # capital_expenditures = 0.0 # Placeholder
-            cfi = acquisition_outflow # + capital_expenditures
-            cf_data["Acquisition Costs Outflow"].append(acquisition_outflow) # Recorded as negative
-            cf_data["Cash Flow from Investing (CFI)"].append(cfi)
-
-            # --- 3. Cash Flow from Financing (CFF) ---
-            loan_proceeds = 0.0
-            equity_injected = 0.0
-
-            if month == 1:
-                loan_proceeds = self._loan_amount # Inflow
-                equity_injected = self._initial_equity # Inflow
-
-            # Principal repayment calculation (remains the same)
-            principal_repayment_outflow = 0.0
-            if month in loan_schedule.index:
-                principal_repayment_outflow = loan_schedule.loc[month, 'Principal Payment']
-            
-
-            # CFF = Inflows - Outflows
-            cff = loan_proceeds + equity_injected - principal_repayment_outflow
-            cf_data["Loan Proceeds"].append(loan_proceeds)
-            cf_data["Equity Injected"].append(equity_injected)
-            cf_data["Loan Principal Repayment"].append(-principal_repayment_outflow) # Report as negative
-            cf_data["Cash Flow from Financing (CFF)"].append(cff)
-
-            # --- 4. Summary ---
-            net_change_in_cash = cfo + cfi + cff
-            beginning_cash = bs_prev_month.get("Cash", 0.0) # Cash at end of previous month
-            ending_cash = beginning_cash + net_change_in_cash
-
-            cf_data["Net Change in Cash"].append(net_change_in_cash)
-            cf_data["Beginning Cash Balance"].append(beginning_cash)
-            cf_data["Ending Cash Balance"].append(ending_cash)
-
         # --- Create DataFrame ---
         df_cf = pd.DataFrame(cf_data)
         df_cf.index = range(1, num_months + 1) # Set index 1 to num_months
@@ -154,5 +120,4 @@ class CashFlow:
         ]
         df_cf = df_cf[ordered_cols]
 
-        print(f"\nDEBUG: CF DataFrame columns = {df_cf.columns.tolist()}")
         return df_cf
@@ -160,18 +160,14 @@ class LoanCalculator:
         )
         durations = durations[durations > 0]  # Ensure positive durations
 
-        # Build sensitivity matrix
-        sensitivity_data: Dict[str, List[float]] = {}
-        
-        for rate in rates:
-            rate_label = f"{rate*100:.1f}%"
-            payments = []
-            
-            for duration in durations:
-                payment = self.calculate_monthly_payment(loan_amount, rate, int(duration))
-                payments.append(payment)
-            
-            sensitivity_data[rate_label] = payments
+        # Build sensitivity matrix in one broadcast call (rows = durations, cols = rates)
+        # Zero payment when rate or loan is zero, as in calculate_monthly_payment
+        payments = np.abs(npf.pmt(rates[np.newaxis, :] / 12, durations[:, np.newaxis], loan_amount))
+        payments = np.where((rates[np.newaxis, :] == 0) | (loan_amount == 0), 0.0, payments)
+
+        sensitivity_data: Dict[str, np.ndarray] = {
+            f"{rate*100:.1f}%": payments[:, col] for col, rate in enumerate(rates)
+        }
 
         df_sensitivity = pd.DataFrame(sensitivity_data, index=durations.astype(int))
         df_sensitivity.index.name = "Duration (Months)"
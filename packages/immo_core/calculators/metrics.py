@@ -91,31 +91,35 @@ class InvestmentMetrics:
                 "net_exit_proceeds": 0.0
             }
         
-    def calculate_irr(self, cf_df: pd.DataFrame, bs_df: pd.DataFrame) -> float:
+    def _annual_cash_flows(self, cf_df: pd.DataFrame) -> pd.Series:
+        """
+        Sums monthly 'Net Change in Cash' by year in a single groupby.
+
+        Returns:
+            Series indexed by year (1 to holding_period_years), 0.0 for missing years
+        """
+        annual_cf = cf_df.groupby('Year')['Net Change in Cash'].sum()
+        return annual_cf.reindex(range(1, self.params.holding_period_years + 1), fill_value=0.0)
+
+    def calculate_irr(self, cf_df: pd.DataFrame, bs_df: pd.DataFrame,
+                      exit_data: Optional[Dict[str, float]] = None,
+                      annual_cf: Optional[pd.Series] = None) -> float:
         """
         Calculates IRR using ANNUAL cash flows (not monthly).
+
+        Args:
+            exit_data: Precomputed exit proceeds (computed if None)
+            annual_cf: Precomputed yearly net cash flows (computed if None)
         """
         try:
-            exit_data = self.calculate_exit_proceeds(cf_df, bs_df)
+            if exit_data is None:
+                exit_data = self.calculate_exit_proceeds(cf_df, bs_df)
             net_exit_proceeds = exit_data.get('net_exit_proceeds', 0.0)
             
-            # Build ANNUAL cash flow array
-            cash_flows = [-self._initial_equity]  # Year 0
-            
-            # Group by year and sum net changes (exclude Year 0 if it exists)
-            cf_df_copy = cf_df.copy()
-            cf_df_copy['Year_Index'] = cf_df_copy['Year']
-            
-            # Filter out Year 0 to avoid double-counting initial equity
-            cf_df_filtered = cf_df_copy[cf_df_copy['Year_Index'] > 0]
-            annual_cf = cf_df_filtered.groupby('Year_Index')['Net Change in Cash'].sum()
-            
-            # Add annual cash flows for each year
-            for year in range(1, self.params.holding_period_years + 1):
-                if year in annual_cf.index:
-                    cash_flows.append(annual_cf[year])
-                else:
-                    cash_flows.append(0.0)
+            # Build ANNUAL cash flow array (Year 0 = initial equity, then years 1..N)
+            if annual_cf is None:
+                annual_cf = self._annual_cash_flows(cf_df)
+            cash_flows = [-self._initial_equity] + annual_cf.tolist()
             
             # Add exit proceeds to final year
             if len(cash_flows) > 1:  # Ensure we have at least one year beyond initial investment
@@ -131,12 +135,14 @@ class InvestmentMetrics:
             return 0.0
 
     def calculate_npv(self, cf_df: pd.DataFrame, bs_df: pd.DataFrame, 
-                      discount_rate: Optional[float] = None) -> float:
+                      discount_rate: Optional[float] = None,
+                      exit_data: Optional[Dict[str, float]] = None) -> float:
         """
         Calculates Net Present Value (NPV) at a given discount rate.
         
         Args:
             discount_rate: Annual discount rate (uses params default if None)
+            exit_data: Precomputed exit proceeds (computed if None)
         
         Returns:
             NPV in euros
@@ -147,18 +153,13 @@ class InvestmentMetrics:
             
             monthly_discount_rate = (1 + discount_rate) ** (1/12) - 1
             
-            exit_data = self.calculate_exit_proceeds(cf_df, bs_df)
+            if exit_data is None:
+                exit_data = self.calculate_exit_proceeds(cf_df, bs_df)
             net_exit_proceeds = exit_data.get('net_exit_proceeds', 0.0)
             
-            # Build cash flow array (same as IRR)
-            cash_flows = [-self._initial_equity]
-            
-            for month in range(1, len(cf_df) + 1):
-                if month in cf_df.index:
-                    net_change = cf_df.loc[month, 'Net Change in Cash']
-                    cash_flows.append(net_change)
-                else:
-                    cash_flows.append(0.0)
+            # Build monthly cash flow array (Month 0 = initial equity, then months 1..N)
+            monthly_cf = cf_df['Net Change in Cash'].reindex(range(1, len(cf_df) + 1), fill_value=0.0)
+            cash_flows = np.concatenate(([-self._initial_equity], monthly_cf.to_numpy(dtype=float)))
             
             cash_flows[-1] += net_exit_proceeds
             
@@ -171,15 +172,21 @@ class InvestmentMetrics:
             print(f"Error calculating NPV: {e}")
             return 0.0
 
-    def calculate_cash_on_cash(self, cf_df: pd.DataFrame) -> float:
+    def calculate_cash_on_cash(self, cf_df: pd.DataFrame,
+                               annual_cf: Optional[pd.Series] = None) -> float:
         """
         Calculates Cash-on-Cash return (Year 1 cash flow / Initial equity).
+
+        Args:
+            annual_cf: Precomputed yearly net cash flows (computed if None)
         
         Returns:
             Cash-on-Cash as decimal (e.g., 0.05 for 5%)
         """
         try:
-            year_1_cf = cf_df[cf_df['Year'] == 1]['Net Change in Cash'].sum()
+            if annual_cf is None:
+                annual_cf = self._annual_cash_flows(cf_df)
+            year_1_cf = annual_cf.get(1, 0.0)
             
             if self._initial_equity > 0:
                 return year_1_cf / self._initial_equity
@@ -190,9 +197,13 @@ class InvestmentMetrics:
             print(f"Error calculating Cash-on-Cash: {e}")
             return 0.0
 
-    def calculate_equity_multiple(self, cf_df: pd.DataFrame, bs_df: pd.DataFrame) -> float:
+    def calculate_equity_multiple(self, cf_df: pd.DataFrame, bs_df: pd.DataFrame,
+                                  exit_data: Optional[Dict[str, float]] = None) -> float:
         """
         Calculates Equity Multiple (Total cash returned / Initial equity).
+
+        Args:
+            exit_data: Precomputed exit proceeds (computed if None)
         
         Returns:
             Equity multiple as ratio (e.g., 1.5 means 1.5x return)
@@ -202,7 +213,8 @@ class InvestmentMetrics:
             total_operating_cf = cf_df['Net Change in Cash'].sum()
             
             # Exit proceeds
-            exit_data = self.calculate_exit_proceeds(cf_df, bs_df)
+            if exit_data is None:
+                exit_data = self.calculate_exit_proceeds(cf_df, bs_df)
             net_exit_proceeds = exit_data.get('net_exit_proceeds', 0.0)
             
             total_cash_returned = total_operating_cf + net_exit_proceeds
@@ -398,18 +410,20 @@ class InvestmentMetrics:
     def calculate_all_metrics(self, cf_df: pd.DataFrame, bs_df: pd.DataFrame) -> Dict[str, any]:
         """
         Calculates all investment metrics at once.
+        Exit proceeds and yearly cash flows are computed once and shared.
         
         Returns:
             Dict with all metrics and exit details
         """
         try:
             exit_data = self.calculate_exit_proceeds(cf_df, bs_df)
+            annual_cf = self._annual_cash_flows(cf_df)
             
             metrics = {
-                'irr': self.calculate_irr(cf_df, bs_df),
-                'npv': self.calculate_npv(cf_df, bs_df),
-                'cash_on_cash': self.calculate_cash_on_cash(cf_df),
-                'equity_multiple': self.calculate_equity_multiple(cf_df, bs_df),
+                'irr': self.calculate_irr(cf_df, bs_df, exit_data=exit_data, annual_cf=annual_cf),
+                'npv': self.calculate_npv(cf_df, bs_df, exit_data=exit_data),
+                'cash_on_cash': self.calculate_cash_on_cash(cf_df, annual_cf=annual_cf),
+                'equity_multiple': self.calculate_equity_multiple(cf_df, bs_df, exit_data=exit_data),
                 **exit_data  # Include all exit details
             }
             
@@ -5,7 +5,7 @@
 import pandas as pd
 import numpy_financial as npf
 import numpy as np
-from typing import Dict, List
+from typing import Dict
 from ..models.params import ModelParameters
 from ..fiscal.taxes import Taxes 
 
@@ -54,158 +54,121 @@ class PnL:
             raise ValueError(f"Lease type '{lease_type}' not found in parameters.")
 
         num_months = self.params.holding_period_years * 12
-        months = list(range(1, num_months + 1))
-        years = [(m - 1) // 12 + 1 for m in months]
+        months = np.arange(1, num_months + 1)
+        years = (months - 1) // 12 + 1
+        month_index = (months - 1) % 12
+        days_in_month_approx = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+        zeros = np.zeros(num_months)
 
-        # --- Data Storage ---
-        pnl_data: Dict[str, List[float]] = {
+        # --- 1. Revenue Calculation ---
+        assumptions = self.params.rental_assumptions[lease_type]
+        rent_growth_rate = assumptions.get("rent_growth_rate", 0.0)
+        annual_growth_factor = (1 + rent_growth_rate) ** (years - 1)
+
+        gross_potential_rent = zeros
+        vacancy_loss = zeros
+        goi = zeros
+
+        if lease_type == "airbnb":
+            daily_rate = assumptions.get("daily_rate", 0.0)
+            occupancy_rate = assumptions.get("occupancy_rate", 0.0)
+            seasonality = np.asarray(assumptions.get("monthly_seasonality", [1.0]*12), dtype=float)
+
+            current_daily_rate = daily_rate * annual_growth_factor
+            gross_potential_rent = current_daily_rate * days_in_month_approx[month_index]
+
+            # Apply occupancy and seasonality
+            goi = gross_potential_rent * occupancy_rate * seasonality[month_index]
+
+        elif lease_type in ["furnished_1yr", "unfurnished_3yr"]:
+            monthly_rent_sqm = assumptions.get("monthly_rent_sqm", 0.0)
+            monthly_vacancy_rate = assumptions.get("vacancy_rate", 0.0) / 12
+
+            gross_potential_rent = monthly_rent_sqm * self.params.property_size_sqm * annual_growth_factor
+            vacancy_loss = gross_potential_rent * monthly_vacancy_rate
+            goi = gross_potential_rent - vacancy_loss
+
+        # --- 2. Operating Expenses Calculation ---
+        exp_growth_factor = (1 + self.params.expenses_growth_rate) ** (years - 1)
+
+        prop_tax = (self.params.property_tax_yearly / 12) * exp_growth_factor
+        pno_ins = (self.params.pno_insurance_yearly / 12) * exp_growth_factor
+        condo_fees = self.params.condo_fees_monthly * exp_growth_factor
+
+        maintenance = goi * self.params.maintenance_percentage_rent
+        management_rate = self.params.management_fees_percentage_rent.get(lease_type, 0.0)
+        management_fees = goi * management_rate
+
+        airbnb_costs = zeros
+        if lease_type == "airbnb":
+            airbnb_costs = goi * self.params.airbnb_specific_costs_percentage_rent
+
+        total_opex = (prop_tax + condo_fees + pno_ins +
+                      maintenance + management_fees + airbnb_costs)
+        noi = goi - total_opex
+
+        # --- 3. Financing Costs ---
+        monthly_rate = self.params.loan_interest_rate / 12
+        loan_years = self.params.loan_duration_years
+        in_loan = months <= loan_years * 12
+
+        interest = np.zeros(num_months)
+        if monthly_rate > 0 and loan_years > 0 and self._loan_amount > 0:
+            interest[in_loan] = np.abs(npf.ipmt(monthly_rate, months[in_loan], loan_years * 12, self._loan_amount))
+
+        insurance = np.where(in_loan, self._yearly_loan_insurance_cost / 12, 0.0)
+
+        # --- 4. Depreciation & Amortization ---
+        # Calculated for the accounting P&L; the Tax class decides whether it
+        # reduces taxable income
+        prop_amort = np.where(years <= self.params.lmnp_amortization_property_years,
+                              self._yearly_property_amortization / 12, 0.0)
+        furn_amort = np.where(years <= self.params.lmnp_amortization_furnishing_years,
+                              self._yearly_furnishing_amortization / 12, 0.0)
+        reno_amort = np.where(years <= self.params.lmnp_amortization_renovation_years,
+                              self._yearly_renovation_amortization / 12, 0.0)
+        depreciation = prop_amort + furn_amort + reno_amort
+
+        # --- 5. Taxes (Integration) ---
+        # Calculate expenses deductible for tax purposes (Cash based)
+        deductible_expenses = total_opex + interest + insurance
+
+        # Delegate calculation to Taxes class
+        # It handles Micro vs Real logic and depreciation deductibility
+        tax_results = self.tax_calculator.calculate_tax_details_array(
+            gross_revenue=goi,
+            deductible_expenses=deductible_expenses,
+            depreciation=depreciation,
+            lease_type=lease_type
+        )
+
+        # --- 6. Net Income ---
+        # Accounting Net Income (NOI - Financing - Depreciation - Taxes)
+        net_income = (noi - interest - insurance - depreciation) - tax_results["total_taxes"]
+
+        pnl_data: Dict[str, np.ndarray] = {
             "Year": years,
-            "Gross Potential Rent": [],
-            "Vacancy Loss": [],
-            "Gross Operating Income": [],
-            "Property Tax": [],
-            "Condo Fees": [],
-            "PNO Insurance": [],
-            "Maintenance": [],
-            "Management Fees": [],
-            "Airbnb Specific Costs": [],
-            "Total Operating Expenses": [],
-            "Net Operating Income": [],
-            "Loan Interest": [],
-            "Loan Insurance": [],
-            "Depreciation/Amortization": [],
-            "Taxable Income": [], # New field from Tax class
-            "Income Tax": [],
-            "Social Contributions": [],
-            "Total Taxes": [],
-            "Net Income": [],
+            "Gross Potential Rent": gross_potential_rent,
+            "Vacancy Loss": vacancy_loss,
+            "Gross Operating Income": goi,
+            "Property Tax": prop_tax,
+            "Condo Fees": condo_fees,
+            "PNO Insurance": pno_ins,
+            "Maintenance": maintenance,
+            "Management Fees": management_fees,
+            "Airbnb Specific Costs": airbnb_costs,
+            "Total Operating Expenses": total_opex,
+            "Net Operating Income": noi,
+            "Loan Interest": interest,
+            "Loan Insurance": insurance,
+            "Depreciation/Amortization": depreciation,
+            "Taxable Income": tax_results["taxable_income"],
+            "Income Tax": tax_results["income_tax"],
+            "Social Contributions": tax_results["social_contributions"],
+            "Total Taxes": tax_results["total_taxes"],
+            "Net Income": net_income,
         }
 
-        # --- Monthly Loop ---
-        for month in months:
-            current_year = pnl_data["Year"][month-1]
-            month_index = (month - 1) % 12 
-            days_in_month_approx = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-
-            # --- 1. Revenue Calculation ---
-            assumptions = self.params.rental_assumptions[lease_type]
-            rent_growth_rate = assumptions.get("rent_growth_rate", 0.0)
-            annual_growth_factor = (1 + rent_growth_rate) ** (current_year - 1)
-
-            gross_potential_rent_month = 0.0
-            vacancy_loss_month = 0.0
-            goi_month = 0.0
-
-            if lease_type == "airbnb":
-                daily_rate = assumptions.get("daily_rate", 0.0)
-                occupancy_rate = assumptions.get("occupancy_rate", 0.0)
-                seasonality = assumptions.get("monthly_seasonality", [1.0]*12)
-                
-                current_daily_rate = daily_rate * annual_growth_factor
-                gross_potential_rent_month = current_daily_rate * days_in_month_approx[month_index]
-                
-                # Apply occupancy and seasonality
-                goi_month = gross_potential_rent_month * occupancy_rate * seasonality[month_index]
-                vacancy_loss_month = 0.0 
-
-            elif lease_type in ["furnished_1yr", "unfurnished_3yr"]:
-                monthly_rent_sqm = assumptions.get("monthly_rent_sqm", 0.0)
-                monthly_vacancy_rate = assumptions.get("vacancy_rate", 0.0) / 12 
-                
-                current_monthly_rent = monthly_rent_sqm * self.params.property_size_sqm * annual_growth_factor
-                gross_potential_rent_month = current_monthly_rent
-                vacancy_loss_month = gross_potential_rent_month * monthly_vacancy_rate
-                goi_month = gross_potential_rent_month - vacancy_loss_month
-
-            pnl_data["Gross Potential Rent"].append(gross_potential_rent_month)
-            pnl_data["Vacancy Loss"].append(vacancy_loss_month)
-            pnl_data["Gross Operating Income"].append(goi_month)
-
-            # --- 2. Operating Expenses Calculation ---
-            exp_growth_factor = (1 + self.params.expenses_growth_rate) ** (current_year - 1)
-
-            prop_tax_month = (self.params.property_tax_yearly / 12) * exp_growth_factor
-            pno_ins_month = (self.params.pno_insurance_yearly / 12) * exp_growth_factor
-            condo_fees_month = self.params.condo_fees_monthly * exp_growth_factor
-
-            maintenance_month = goi_month * self.params.maintenance_percentage_rent
-            management_rate = self.params.management_fees_percentage_rent.get(lease_type, 0.0)
-            management_fees_month = goi_month * management_rate
-            
-            airbnb_costs_month = 0.0
-            if lease_type == "airbnb":
-                airbnb_costs_month = goi_month * self.params.airbnb_specific_costs_percentage_rent
-
-            total_opex_month = (prop_tax_month + condo_fees_month + pno_ins_month +
-                                maintenance_month + management_fees_month + airbnb_costs_month)
-            noi_month = goi_month - total_opex_month
-
-            pnl_data["Property Tax"].append(prop_tax_month)
-            pnl_data["Condo Fees"].append(condo_fees_month)
-            pnl_data["PNO Insurance"].append(pno_ins_month)
-            pnl_data["Maintenance"].append(maintenance_month)
-            pnl_data["Management Fees"].append(management_fees_month)
-            pnl_data["Airbnb Specific Costs"].append(airbnb_costs_month)
-            pnl_data["Total Operating Expenses"].append(total_opex_month)
-            pnl_data["Net Operating Income"].append(noi_month)
-
-            # --- 3. Financing Costs ---
-            interest_month = 0.0
-            monthly_rate = self.params.loan_interest_rate / 12
-            loan_years = self.params.loan_duration_years
-            
-            if monthly_rate > 0 and loan_years > 0 and self._loan_amount > 0 and month <= loan_years * 12:
-                interest_month = abs(npf.ipmt(monthly_rate, month, loan_years * 12, self._loan_amount))
-
-            insurance_month = (self._yearly_loan_insurance_cost / 12) if month <= loan_years * 12 else 0.0
-
-            pnl_data["Loan Interest"].append(interest_month)
-            pnl_data["Loan Insurance"].append(insurance_month)
-
-            # --- 4. Depreciation & Amortization ---
-            # Logic now relies on params, Tax class validates if it applies to taxable income
-            depreciation_month = 0.0
-            
-            # Check if we are in a regime that allows amortization in our model
-            # (We calculate it for Accounting P&L even if Tax class ignores it for taxable income)
-            prop_amort_month = 0.0
-            if current_year <= self.params.lmnp_amortization_property_years:
-                prop_amort_month = self._yearly_property_amortization / 12
-            
-            furn_amort_month = 0.0
-            if current_year <= self.params.lmnp_amortization_furnishing_years:
-                 furn_amort_month = self._yearly_furnishing_amortization / 12
-
-            reno_amort_month = 0.0
-            if current_year <= self.params.lmnp_amortization_renovation_years:
-                 reno_amort_month = self._yearly_renovation_amortization / 12
-
-            depreciation_month = prop_amort_month + furn_amort_month + reno_amort_month
-            pnl_data["Depreciation/Amortization"].append(depreciation_month)
-
-            # --- 5. Taxes (Integration) ---
-            # Calculate expenses deductible for tax purposes (Cash based)
-            deductible_expenses_month = total_opex_month + interest_month + insurance_month
-            
-            # Delegate calculation to Taxes class
-            # It handles Micro vs Real logic and depreciation deductibility
-            tax_results_month = self.tax_calculator.calculate_tax_details(
-                gross_revenue=goi_month,
-                deductible_expenses=deductible_expenses_month,
-                depreciation=depreciation_month,
-                lease_type=lease_type
-            )
-
-            pnl_data["Taxable Income"].append(tax_results_month["taxable_income"])
-            pnl_data["Income Tax"].append(tax_results_month["income_tax"])
-            pnl_data["Social Contributions"].append(tax_results_month["social_contributions"])
-            pnl_data["Total Taxes"].append(tax_results_month["total_taxes"])
-
-            # --- 6. Net Income ---
-            # Accounting Net Income (NOI - Financing - Depreciation - Taxes)
-            net_income_month = (noi_month - interest_month - insurance_month - depreciation_month) - tax_results_month["total_taxes"]
-            pnl_data["Net Income"].append(net_income_month)
-
         # --- Create DataFrame ---
         df_pnl = pd.DataFrame(pnl_data)
         df_pnl.index = months 
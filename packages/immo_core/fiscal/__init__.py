@@ -1,4 +1,7 @@
-from .taxes import Taxes
+from .taxes import Taxes, DEDUCTIBLE_EXPENSE_COLUMNS, YEAR1_FISCAL_COLUMNS
 from .advisor import FiscalAdvisor, LeaseType, FiscalRegime
 
-__all__ = ["Taxes", "FiscalAdvisor", "LeaseType", "FiscalRegime"]
\ No newline at end of file
+__all__ = [
+    "Taxes", "FiscalAdvisor", "LeaseType", "FiscalRegime",
+    "DEDUCTIBLE_EXPENSE_COLUMNS", "YEAR1_FISCAL_COLUMNS",
+]
\ No newline at end of file
@@ -1,13 +1,43 @@
+import operator
 from dataclasses import dataclass
 from typing import Dict
+import numpy as np
 from ..models.params import ModelParameters
 
+
+# Colonnes du P&L utilisées pour la comparaison fiscale de l'année 1 (API)
+DEDUCTIBLE_EXPENSE_COLUMNS = [
+    "Property Tax", "Condo Fees", "PNO Insurance", "Maintenance",
+    "Management Fees", "Loan Interest", "Loan Insurance",
+]
+YEAR1_FISCAL_COLUMNS = ["Gross Operating Income", "Depreciation/Amortization"] + DEDUCTIBLE_EXPENSE_COLUMNS
+
+
+def _build_abatement_tables() -> tuple:
+    """
+    Pré-calcule les taux d'abattement plus-value (IR et PS) indexés par
+    années de détention (0 à 30), selon le même barème que le calcul scalaire.
+    """
+    abatement_ir = np.zeros(31)
+    abatement_ps = np.zeros(31)
+    for years in range(6, 22):
+        abatement_ir[years] = (years - 5) * 0.06
+        abatement_ps[years] = (years - 5) * 0.0165
+    abatement_ir[22:] = 1.0
+    abatement_ps[22] = (16 * 0.0165) + 0.0160
+    for years in range(23, 31):
+        abatement_ps[years] = (16 * 0.0165) + 0.0160 + ((years - 22) * 0.09)
+    return abatement_ir, abatement_ps
+
 class Taxes:
     """
     Gère la fiscalité française (revenus locatifs et plus-values).
     Sources: règles_impots.txt et règles générales des plus-values immobilières.
     """
 
+    # Barèmes d'abattement pour durée de détention (index = années détenues)
+    ABATEMENT_IR, ABATEMENT_PS = _build_abatement_tables()
+
     def __init__(self, params: ModelParameters):
         self.params = params
         self.social_contributions_rate = 0.172  # 17.2% CSG/CRDS
@@ -60,12 +90,57 @@ class Taxes:
             "total_taxes": income_tax + social_contributions
         }
 
+    def calculate_tax_details_array(self,
+                                    gross_revenue: np.ndarray,
+                                    deductible_expenses: np.ndarray,
+                                    depreciation: np.ndarray,
+                                    lease_type: str) -> Dict[str, np.ndarray]:
+        """
+        Version vectorisée de calculate_tax_details (toutes les périodes d'un coup).
+        Mêmes règles de régime ; retourne les mêmes clés sous forme de tableaux.
+        """
+        gross_revenue = np.asarray(gross_revenue, dtype=float)
+        deductible_expenses = np.asarray(deductible_expenses, dtype=float)
+        depreciation = np.asarray(depreciation, dtype=float)
+
+        regime = self.params.fiscal_regime
+        taxable_income = np.zeros_like(gross_revenue)
+
+        # --- 1. Calcul de l'assiette (Revenus Locatifs) ---
+        if "Micro" in regime:
+            abatement = self._get_micro_abatement_rate(lease_type)
+            taxable_income = gross_revenue * (1 - abatement)
+        elif "Réel" in regime:
+            net_operating_result = gross_revenue - deductible_expenses
+
+            if "LMNP" in regime:
+                # L'amortissement ne peut pas créer de déficit
+                taxable_income = np.maximum(0.0, net_operating_result - depreciation)
+            else:
+                taxable_income = net_operating_result
+
+        # --- 2. Calcul des Impôts ---
+        tax_base = np.maximum(0.0, taxable_income)
+
+        income_tax = tax_base * self.params.personal_income_tax_bracket
+        social_contributions = tax_base * self.social_contributions_rate
+
+        return {
+            "taxable_income": taxable_income,
+            "income_tax": income_tax,
+            "social_contributions": social_contributions,
+            "total_taxes": income_tax + social_contributions
+        }
+
     def calculate_capital_gain_tax(self, selling_price: float, purchase_price: float, years_held: int) -> Dict[str, float]:
         """
         Calcul l'impôt sur la plus-value immobilière à la revente.
         Règle Spécifique Utilisateur : Exonération totale si détention >= 25 ans.
         Sinon : Application des abattements légaux standards (IR et PS).
+        years_held doit être un nombre entier d'années (TypeError sinon).
         """
+        years_held = operator.index(years_held)
+
         # Règle utilisateur : Exonération totale après 25 ans
         if years_held >= 25:
             return {
@@ -89,26 +164,12 @@ class Taxes:
              return {"total_exit_tax": 0.0, "gross_capital_gain": 0.0}
 
         # --- Calcul des Abattements (Durée de détention) ---
-        # 1. Impôt sur le Revenu (IR) - Taux 19%
-        # 6-21 ans : 6%/an, 22 ans : 4%
-        if years_held < 6:
-            abatement_ir = 0.0
-        elif years_held <= 21:
-            abatement_ir = (years_held - 5) * 0.06
-        else: 
-            abatement_ir = 1.0 # Exonéré IR après 22 ans (règle FR standard)
-
-        # 2. Prélèvements Sociaux (PS) - Taux 17.2%
-        # 6-21 ans : 1.65%/an, 22 ans : 1.6%, 23-30 ans : 9%
-        if years_held < 6:
-            abatement_ps = 0.0
-        elif years_held <= 21:
-            abatement_ps = (years_held - 5) * 0.0165
-        elif years_held == 22:
-            abatement_ps = (16 * 0.0165) + 0.0160
-        else:
-            # Pour < 25 ans (car >= 25 est géré par le if au début)
-            abatement_ps = (16 * 0.0165) + 0.0160 + ((years_held - 22) * 0.09)
+        # Lecture directe dans les barèmes pré-calculés (cf. _build_abatement_tables)
+        # IR (19%) : 6%/an de 6 à 21 ans, exonéré après 22 ans
+        # PS (17.2%) : 1.65%/an de 6 à 21 ans, 1.6% la 22e, 9%/an de 23 à 30 ans
+        years_index = min(max(years_held, 0), 30)
+        abatement_ir = float(self.ABATEMENT_IR[years_index])
+        abatement_ps = float(self.ABATEMENT_PS[years_index])
 
         # --- Calcul Final ---
         taxable_base_ir = gross_capital_gain * (1 - abatement_ir)
@@ -124,4 +185,55 @@ class Taxes:
             "tax_ir": tax_ir,
             "tax_ps": tax_ps,
             "total_exit_tax": tax_ir + tax_ps
-        }
\ No newline at end of file
+        }
+
+    def calculate_capital_gain_tax_array(self,
+                                         selling_price: np.ndarray,
+                                         purchase_price: np.ndarray,
+                                         years_held: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Version vectorisée de calculate_capital_gain_tax (scénarios multiples).
+        Mêmes règles : exonération totale si détention >= 25 ans, sinon
+        abattements IR/PS lus dans les barèmes pré-calculés.
+        Retourne les mêmes clés que la version scalaire, sous forme de tableaux.
+        years_held doit contenir des années entières (TypeError sinon).
+        """
+        selling_price = np.asarray(selling_price, dtype=float)
+        purchase_price = np.asarray(purchase_price, dtype=float)
+        years_held = np.asarray(years_held)
+        if not np.issubdtype(years_held.dtype, np.integer):
+            raise TypeError(f"years_held must contain whole years, got dtype {years_held.dtype}")
+
+        exempt = years_held >= 25
+
+        # --- Prix d'acquisition corrigé (forfaits 7.5% frais + 15% travaux si > 5 ans) ---
+        acquisition_costs_flat = purchase_price * 0.075
+        works_flat = np.where(years_held > 5, purchase_price * 0.15, 0.0)
+        adjusted_purchase_price = purchase_price + acquisition_costs_flat + works_flat
+
+        gross_capital_gain = np.where(
+            exempt,
+            np.maximum(0.0, selling_price - purchase_price),
+            np.maximum(0.0, selling_price - adjusted_purchase_price)
+        )
+
+        # --- Abattements (durée de détention) ---
+        years_index = np.clip(years_held, 0, 30).astype(int)
+        abatement_ir = self.ABATEMENT_IR[years_index]
+        abatement_ps = self.ABATEMENT_PS[years_index]
+
+        # --- Calcul Final (nul si exonéré) ---
+        taxable_base_ir = np.where(exempt, 0.0, gross_capital_gain * (1 - abatement_ir))
+        taxable_base_ps = np.where(exempt, 0.0, gross_capital_gain * (1 - abatement_ps))
+
+        tax_ir = taxable_base_ir * 0.19
+        tax_ps = taxable_base_ps * self.social_contributions_rate
+
+        return {
+            "gross_capital_gain": gross_capital_gain,
+            "net_taxable_gain_ir": taxable_base_ir,
+            "net_taxable_gain_ps": taxable_base_ps,
+            "tax_ir": tax_ir,
+            "tax_ps": tax_ps,
+            "total_exit_tax": tax_ir + tax_ps
+        }
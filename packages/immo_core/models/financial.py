@@ -1,6 +1,7 @@
 # In file: scripts/_0_financial_model.py
 
 import pandas as pd
+import numpy as np
 from typing import Dict, Optional
 from .params import ModelParameters
 from ..calculators.pnl import PnL
@@ -9,6 +10,7 @@ from ..calculators.cash_flow import CashFlow
 from ..calculators.transaction import TransactionCalculator
 from ..calculators.loan import LoanCalculator
 from ..calculators.metrics import InvestmentMetrics
+from ..utils.frames import column_as_array
 
 class FinancialModel:
     """
@@ -96,35 +98,23 @@ class FinancialModel:
         # --- 6. Generate Preliminary BS for CF Input ---
         num_months = self.params.holding_period_years * 12
         
-        # Initialize placeholder BS data
-        placeholder_bs_data = {
-            'Cash': [0.0],  # Initial cash at Month 0
-            'Loan Balance': [self.params.loan_amount]
-        }
+        months = range(1, num_months + 1)
         
-        # Build placeholder BS month by month
-        for m in range(1, num_months + 1):
-            prev_cash = placeholder_bs_data['Cash'][-1]
-            
-            # Get loan balance from schedule
-            if m in self.loan_schedule.index:
-                current_loan_bal = self.loan_schedule.loc[m, 'Ending Balance']
-                principal_paid = self.loan_schedule.loc[m, 'Principal Payment']
-            else:
-                current_loan_bal = 0.0
-                principal_paid = 0.0
-            
-            # Simple cash calculation: previous + net income - principal payment
-            net_income = self.pnl_statement.loc[m].get("Net Income", 0.0) if m in self.pnl_statement.index else 0.0
-            depreciation = self.pnl_statement.loc[m].get("Depreciation/Amortization", 0.0) if m in self.pnl_statement.index else 0.0
-            current_cash = prev_cash + net_income + depreciation - principal_paid 
-            
-            placeholder_bs_data['Cash'].append(current_cash)
-            placeholder_bs_data['Loan Balance'].append(current_loan_bal)
-
-        # Create placeholder BS DataFrame
+        # Extract P&L and loan schedule columns once (0.0 where a month is missing)
+        net_income = column_as_array(self.pnl_statement, "Net Income", months)
+        depreciation = column_as_array(self.pnl_statement, "Depreciation/Amortization", months)
+        principal_paid = column_as_array(self.loan_schedule, "Principal Payment", months)
+        loan_balance = column_as_array(self.loan_schedule, "Ending Balance", months)
+        
+        # Simple cash calculation: previous + net income - principal payment
+        cash = np.cumsum(net_income + depreciation - principal_paid)
+        
+        # Create placeholder BS DataFrame (Month 0 = initial cash and loan amount)
         bs_df_placeholder = pd.DataFrame(
-            placeholder_bs_data, 
+            {
+                'Cash': np.concatenate(([0.0], cash)),
+                'Loan Balance': np.concatenate(([self.params.loan_amount], loan_balance))
+            },
             index=range(0, num_months + 1)
         )
         bs_df_placeholder.index.name = "Month"
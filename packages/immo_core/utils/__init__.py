@@ -0,0 +1,3 @@
+from .frames import column_as_array
+
+__all__ = ["column_as_array"]
\ No newline at end of file
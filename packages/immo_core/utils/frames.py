@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+from typing import Iterable
+
+
+def column_as_array(df: pd.DataFrame, column: str, index: Iterable[int]) -> np.ndarray:
+    """
+    Extracts a statement column as a float array aligned on the given index.
+
+    Labels missing from the DataFrame (or a missing column) yield 0.0, which
+    matches the per-month `.loc[...]` / `.get(col, 0.0)` fallbacks of the
+    statement generators.
+
+    Args:
+        df: Monthly statement or loan schedule DataFrame.
+        column: Column name to extract.
+        index: Labels (months) to align on.
+
+    Returns:
+        A float64 NumPy array of len(index).
+    """
+    index = list(index)
+    if column not in df.columns:
+        return np.zeros(len(index))
+    return df[column].reindex(index, fill_value=0.0).to_numpy(dtype=float)